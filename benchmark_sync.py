@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the Classy transactions sync pipeline
+
+Runs against synthetic transactions and a local fake Classy endpoint, so no
+network access or credentials are needed. Each benchmark records throughput
+(records per second) and peak memory, and results can be saved as a baseline.
+Later runs are compared to that baseline and the script exits non-zero when a
+benchmark regresses beyond BENCHMARK_REGRESSION_THRESHOLD.
+
+Usage:
+    python3 benchmark_sync.py                    # run 10k and 100k, compare to baseline
+    python3 benchmark_sync.py --sizes 10k 100k 1m
+    python3 benchmark_sync.py --save-baseline    # record the current results as the baseline
+"""
+
+import os
+import re
+import sys
+import gc
+import bisect
+import json
+import time
+import random
+import logging
+import argparse
+import tempfile
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Callable, Optional
+from urllib.parse import urlparse, parse_qs
+
+# Add current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import classy_transactions_sync as sync
+from classy_transactions_sync import ClassyAPIClient, JSONFileClient, JSONFileSink, TransactionProcessor
+from config import (
+    CAMPAIGN_ID,
+    BENCHMARK_BASELINE_PATH,
+    BENCHMARK_REGRESSION_THRESHOLD,
+    BENCHMARK_REPEATS
+)
+
+FIXTURE_SIZES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+DEFAULT_SIZES = ['10k', '100k']
+FIXTURE_SEED = 656775
+PER_PAGE = 100  # Matches the page size used by ClassyAPIClient.fetch_transactions
+MEMORY_REGRESSION_FLOOR_MB = 1.0  # Peak memory may always grow by this much before it counts as a regression
+
+
+# ---------------------------------------------------------------------------
+# Synthetic fixtures
+# ---------------------------------------------------------------------------
+
+def generate_transactions(count: int, seed: int = FIXTURE_SEED) -> List[Dict[str, Any]]:
+    """Generate deterministic raw transactions shaped like the Classy API response"""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    statuses = ['success'] * 17 + ['canceled', 'incomplete', 'refunded']
+    payment_methods = ['Credit Card', 'PayPal', 'ACH', 'Offline']
+    first_names = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie']
+    last_names = ['Lee', 'Garcia', 'Smith', 'Nguyen', 'Patel', 'Brown', 'Kim', 'Lopez']
+    teams = [{'id': 1000 + i, 'name': f'Team {i}'} for i in range(50)]
+    pages = [{'id': 5000 + i, 'title': f'Fundraising Page {i}'} for i in range(500)]
+
+    transactions = []
+    for i in range(count):
+        created = start + timedelta(seconds=i * 30 + rng.randint(0, 29))
+        updated = created + timedelta(minutes=rng.randint(0, 600))
+        gross = round(rng.uniform(5, 500), 2)
+        fees = round(gross * 0.029 + 0.30, 2)
+        team = rng.choice(teams)
+        page = rng.choice(pages)
+
+        transaction = {
+            'id': 10_000_000 + i,
+            'campaign_id': int(CAMPAIGN_ID),
+            'status': rng.choice(statuses),
+            'total_gross_amount': gross,
+            'fees_amount': fees,
+            'donation_net_amount': round(gross - fees, 2),
+            'currency_code': 'USD',
+            'payment_type': 'donation',
+            'payment_method': rng.choice(payment_methods),
+            'created_at': created.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'updated_at': updated.strftime('%Y-%m-%dT%H:%M:%S+0000'),
+            'fundraising_team_id': team['id'],
+            'fundraising_page_id': page['id'],
+            'designation_id': rng.randint(1, 5),
+            'comment': rng.choice(['', '', 'Go team!', 'In memory of a friend']),
+            'is_anonymous': rng.random() < 0.1,
+            'recurring_donation_plan_id': rng.randint(1, 9999) if rng.random() < 0.15 else None,
+            'in_honor_of': rng.choice(['', '', 'Grandma']),
+        }
+
+        # Mirror the API: related objects are sometimes missing
+        if rng.random() < 0.9:
+            first = rng.choice(first_names)
+            last = rng.choice(last_names)
+            transaction['member'] = {
+                'first_name': first,
+                'last_name': last,
+                'email_address': f'{first.lower()}.{last.lower()}{i}@example.org',
+            }
+        else:
+            transaction['member'] = None
+            transaction['member_name'] = ''
+            transaction['member_email_address'] = ''
+        if rng.random() < 0.95:
+            transaction['fundraising_team'] = team
+        if rng.random() < 0.95:
+            transaction['fundraising_page'] = page
+
+        transactions.append(transaction)
+
+    return transactions
+
+
+def generate_date_strings(count: int, seed: int = FIXTURE_SEED) -> List[Optional[str]]:
+    """Generate the mix of date values _format_date sees in practice"""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    dates = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.02:
+            dates.append(None)
+        elif roll < 0.04:
+            dates.append('not-a-date')
+        else:
+            dt = start + timedelta(seconds=i * 30)
+            dates.append(dt.strftime('%Y-%m-%dT%H:%M:%SZ' if roll < 0.5 else '%Y-%m-%dT%H:%M:%S+0000'))
+    return dates
+
+
+# ---------------------------------------------------------------------------
+# Local fake Classy endpoint
+# ---------------------------------------------------------------------------
+
+class FakeClassyServer:
+    """Serve pre-encoded transaction pages and tokens on localhost
+
+    Responses are cached once encoded, so after a warm-up fetch the server thread
+    allocates almost nothing and doesn't inflate the client's peak memory figure.
+    """
+
+    def __init__(self, transactions: List[Dict[str, Any]]):
+        self.transactions = transactions
+        self._pages: Dict[int, bytes] = {}
+        self._responses: Dict[tuple, bytes] = {}
+        self._responses_lock = threading.Lock()
+        # Fixtures are generated in created_at order, so filters can bisect this list
+        self._created = [ClassyAPIClient._parse_api_datetime(t['created_at']) for t in transactions]
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def encode_pages(self, per_page: int = PER_PAGE):
+        """Pre-encode every page so serialization is not counted against the client"""
+        self._pages = {}
+        for offset in range(0, len(self.transactions) + 1, per_page):
+            page = offset // per_page + 1
+            chunk = self.transactions[offset:offset + per_page]
+            self._pages[page] = json.dumps({'data': chunk, 'total': len(self.transactions)}).encode('utf-8')
+
+    def _filtered_range(self, created_filter: Optional[str]) -> tuple:
+        """Return the [lo, hi) slice of transactions matching a created_at>=A,created_at<B filter"""
+        lo, hi = 0, len(self.transactions)
+        for condition in (created_filter or '').split(','):
+            match = re.match(r'created_at(>=|<)(.+)$', condition)
+            if not match:
+                continue
+            bound = ClassyAPIClient._parse_api_datetime(match.group(2))
+            if match.group(1) == '>=':
+                lo = max(lo, bisect.bisect_left(self._created, bound))
+            else:
+                hi = min(hi, bisect.bisect_left(self._created, bound))
+        return lo, max(lo, hi)
+
+    def render_page(self, page: int, per_page: int, created_filter: Optional[str]) -> bytes:
+        """Return the encoded response body for one page of an optionally filtered query"""
+        if not created_filter and per_page == PER_PAGE and page in self._pages:
+            return self._pages[page]
+        key = (page, per_page, created_filter)
+        with self._responses_lock:
+            body = self._responses.get(key)
+        if body is None:
+            lo, hi = self._filtered_range(created_filter)
+            offset = lo + (page - 1) * per_page
+            chunk = self.transactions[offset:min(offset + per_page, hi)]
+            body = json.dumps({'data': chunk, 'total': hi - lo}).encode('utf-8')
+            with self._responses_lock:
+                self._responses[key] = body
+        return body
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, body: bytes):
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                self.rfile.read(length)
+                self._send_json(json.dumps({'access_token': 'benchmark-token', 'expires_in': 3600}).encode('utf-8'))
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                page = int(query.get('page', ['1'])[0])
+                per_page = int(query.get('per_page', [str(PER_PAGE)])[0])
+                created_filter = query.get('filter', [None])[0]
+                self._send_json(server.render_page(page, per_page, created_filter))
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@contextmanager
+def patched_sync_config(**overrides):
+    """Temporarily override config values imported into classy_transactions_sync"""
+    originals = {name: getattr(sync, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(sync, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(sync, name, value)
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def measure(func: Callable[[], Any], records: int, repeats: int) -> Dict[str, Any]:
+    """Time func (best of repeats), then run it once more under tracemalloc for peak memory"""
+    best = float('inf')
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    # tracemalloc slows allocation-heavy code, so memory gets its own pass
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'records': records,
+        'seconds': round(best, 4),
+        'records_per_second': round(records / best, 1) if best > 0 else 0.0,
+        'peak_memory_mb': round(peak / (1024 * 1024), 2),
+    }
+
+
+def run_benchmarks(size_labels: List[str], repeats: int) -> Dict[str, Dict[str, Any]]:
+    """Run every benchmark for each fixture size"""
+    results = {}
+    # Removed afterwards: the 1m export alone is hundreds of MB
+    with tempfile.TemporaryDirectory(prefix='classy-bench-') as workdir:
+        for label in size_labels:
+            count = FIXTURE_SIZES[label]
+            print(f"🏗️  Generating {label} fixture ({count:,} transactions)...")
+            transactions = generate_transactions(count)
+            dates = generate_date_strings(count)
+            processed = TransactionProcessor.process_transactions(transactions)
+
+            print(f"⏱️  Running benchmarks for {label}...")
+            results[f'process_transactions[{label}]'] = measure(
+                lambda: TransactionProcessor.process_transactions(transactions), count, repeats)
+
+            results[f'format_date[{label}]'] = measure(
+                lambda: [TransactionProcessor._format_date(d) for d in dates], count, repeats)
+
+            json_client = JSONFileClient(sinks=[JSONFileSink(os.path.join(workdir, f'export-{label}.json'))])
+            results[f'write_transactions[{label}]'] = measure(
+                lambda: json_client.write_transactions(processed), len(processed), repeats)
+
+            with FakeClassyServer(transactions) as server:
+                server.encode_pages()
+
+                def end_to_end(strategy):
+                    client = ClassyAPIClient()
+                    fetched = client.fetch_transactions(strategy)
+                    # Throughput is reported against the fixture size, so a short fetch must not pass as fast
+                    if len(fetched) != count:
+                        raise RuntimeError(f"{strategy} fetch returned {len(fetched)} of {count} transactions")
+                    json_client.write_transactions(TransactionProcessor.process_transactions(fetched))
+
+                with patched_sync_config(
+                    CLASSY_TOKEN_URL=f"{server.base_url}/oauth2/auth",
+                    CLASSY_API_BASE_URL=server.base_url,
+                    RATE_LIMIT_DELAY=0
+                ):
+                    expected_ids = {transaction['id'] for transaction in transactions}
+                    for strategy, name in [('pages', 'end_to_end_fetch'), ('date_windows', 'end_to_end_windowed')]:
+                        # Untimed run that checks the fetched ids and warms the server's response cache
+                        fetched_ids = [transaction['id'] for transaction in ClassyAPIClient().fetch_transactions(strategy)]
+                        if len(fetched_ids) != count or set(fetched_ids) != expected_ids:
+                            raise RuntimeError(f"{strategy} fetch did not return exactly the fixture transactions")
+                        del fetched_ids
+                        results[f'{name}[{label}]'] = measure(lambda: end_to_end(strategy), count, repeats)
+
+            for name in [n for n in results if n.endswith(f'[{label}]')]:
+                r = results[name]
+                print(f"   {name:<32} {r['records_per_second']:>12,.0f} rec/s  {r['peak_memory_mb']:>9.2f} MB peak")
+
+            del transactions, dates, processed
+            gc.collect()
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    """Load saved baseline results, or an empty dict if none exist"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('results', {})
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, Any]]):
+    """Merge results into the baseline file so partial runs keep other sizes"""
+    merged = load_baseline(path)
+    merged.update(results)
+    baseline = {
+        'metadata': {
+            'generated_at': datetime.now().isoformat(),
+            'python_version': sys.version.split()[0],
+        },
+        'results': merged
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, Any]],
+                        baseline: Dict[str, Dict[str, Any]],
+                        threshold: float) -> List[str]:
+    """Return a description of every benchmark that regressed beyond the threshold"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+
+        min_throughput = previous['records_per_second'] * (1 - threshold)
+        if current['records_per_second'] < min_throughput:
+            regressions.append(
+                f"{name}: throughput {current['records_per_second']:,.0f} rec/s "
+                f"vs baseline {previous['records_per_second']:,.0f} rec/s")
+
+        # Absolute floor so a few KB of incidental allocation on a tiny baseline isn't a regression
+        max_memory = max(previous['peak_memory_mb'] * (1 + threshold),
+                         previous['peak_memory_mb'] + MEMORY_REGRESSION_FLOOR_MB)
+        if current['peak_memory_mb'] > max_memory:
+            regressions.append(
+                f"{name}: peak memory {current['peak_memory_mb']:.2f} MB "
+                f"vs baseline {previous['peak_memory_mb']:.2f} MB")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline benchmarks for the Classy sync pipeline')
+    parser.add_argument('--sizes', nargs='+', choices=list(FIXTURE_SIZES), default=DEFAULT_SIZES,
+                        help='Fixture sizes to run (default: 10k 100k)')
+    parser.add_argument('--repeats', type=int, default=BENCHMARK_REPEATS,
+                        help='Timed runs per benchmark; the best run is kept')
+    parser.add_argument('--baseline', default=BENCHMARK_BASELINE_PATH,
+                        help='Baseline results file')
+    parser.add_argument('--threshold', type=float, default=BENCHMARK_REGRESSION_THRESHOLD,
+                        help='Allowed regression as a fraction (0.25 = 25%%)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Save these results as the new baseline instead of comparing')
+    parser.add_argument('--output', help='Also write the raw results to this JSON file')
+    args = parser.parse_args()
+
+    # Keep the pipeline's per-page INFO logging out of the timings
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+
+    print("📈 Running offline sync benchmarks...\n")
+    results = run_benchmarks(args.sizes, args.repeats)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"\n⚠️  No baseline found at {args.baseline}. Run with --save-baseline to create one.")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+
+    print(f"\n✅ No regressions beyond {args.threshold:.0%} of baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ This script fetches transaction data from the Classy API and saves it to a JSON
 It performs a full refresh of transaction data via cron job.
 
 - Transactions are saved to team-funds-export.json in the WordPress theme directory
+- Optional CSV, SQLite and Google Sheets outputs are written in the same pass (see config.py)
 
 Author: Auto-generated for Velosano
 Date: 2025-01-08
@@ -13,11 +14,18 @@ Updated: 2025-08-21 - Removed registrations processing, replaced Google Sheets w
 """
 
 import os
+import re
 import sys
+import csv
 import json
+import sqlite3
 import time
 import logging
-from datetime import datetime
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional
 import requests
 
@@ -29,12 +37,24 @@ from config import (
     CLASSY_API_BASE_URL,
     CAMPAIGN_ID,
     OUTPUT_FILE_PATH,
+    CSV_OUTPUT_PATH,
+    CSV_BATCH_SIZE,
+    SQLITE_OUTPUT_PATH,
+    SQLITE_TABLE_NAME,
+    GOOGLE_SHEET_ID,
+    GOOGLE_WORKSHEET_NAME,
+    GOOGLE_CREDENTIALS_FILE,
+    SPREADSHEET_BATCH_SIZE,
     LOG_FILE_PATH,
     REQUEST_TIMEOUT,
     MAX_RETRIES,
     RETRY_BACKOFF_FACTOR,
     INITIAL_RETRY_DELAY,
-    RATE_LIMIT_DELAY
+    RATE_LIMIT_DELAY,
+    FETCH_STRATEGY,
+    FETCH_WINDOW_TARGET_RECORDS,
+    FETCH_MAX_WINDOWS,
+    FETCH_WORKERS
 )
 
 
@@ -44,6 +64,9 @@ class ClassyAPIClient:
     def __init__(self):
         self.access_token = None
         self.token_expires_at = 0
+        # Shared across fetch workers so parallel requests still respect RATE_LIMIT_DELAY
+        self._rate_limit_lock = threading.Lock()
+        self._next_request_at = 0.0
         
     def get_access_token(self) -> Optional[str]:
         """Get a valid access token for the Classy API"""
@@ -80,125 +103,605 @@ class ClassyAPIClient:
             logging.error(f"Invalid token response format: {e}")
             return None
     
-    def fetch_transactions(self) -> List[Dict[str, Any]]:
-        """Fetch all transactions from the Classy API with pagination and retry logic"""
+    def fetch_transactions(self, strategy: str = FETCH_STRATEGY) -> List[Dict[str, Any]]:
+        """Fetch all transactions from the Classy API using the configured fetch strategy"""
         access_token = self.get_access_token()
         if not access_token:
             raise Exception("Unable to obtain access token")
         
         headers = {'Authorization': f'Bearer {access_token}'}
+        url = f"{CLASSY_API_BASE_URL}/campaigns/{CAMPAIGN_ID}/transactions"
+        
+        if strategy == 'date_windows':
+            all_transactions = self._fetch_by_date_windows(url, headers)
+        elif strategy == 'pages':
+            all_transactions = self._fetch_pages(url, headers)
+        else:
+            raise ValueError(f"Unknown fetch strategy: {strategy}")
+        
+        logging.info(f"Total transactions fetched: {len(all_transactions)}")
+        return all_transactions
+    
+    def _wait_for_rate_limit(self):
+        """Block until RATE_LIMIT_DELAY has passed since the previous request from any thread"""
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + RATE_LIMIT_DELAY
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _get_with_retry(self, url: str, headers: Dict[str, str], params: Dict[str, Any],
+                        label: str) -> Dict[str, Any]:
+        """GET a JSON response, retrying timeouts and request errors with exponential backoff"""
+        return self._get_response_with_retry(url, headers, params, label)[0]
+    
+    def _get_response_with_retry(self, url: str, headers: Dict[str, str], params: Dict[str, Any],
+                                 label: str) -> tuple:
+        """Like _get_with_retry, but return (data, response) so callers can read response headers"""
+        for attempt in range(MAX_RETRIES + 1):  # +1 for initial attempt
+            self._wait_for_rate_limit()
+            try:
+                if attempt == 0:
+                    logging.info(f"Fetching {label}...")
+                else:
+                    logging.info(f"Retrying {label} (attempt {attempt + 1}/{MAX_RETRIES + 1})...")
+                
+                response = requests.get(
+                    url, 
+                    headers=headers, 
+                    params=params, 
+                    timeout=REQUEST_TIMEOUT
+                )
+                response.raise_for_status()
+                return response.json(), response
+                
+            except requests.exceptions.Timeout as e:
+                if attempt < MAX_RETRIES:
+                    retry_delay = INITIAL_RETRY_DELAY * (RETRY_BACKOFF_FACTOR ** attempt)
+                    logging.warning(f"Timeout on {label}, retrying in {retry_delay} seconds...")
+                    time.sleep(retry_delay)
+                else:
+                    logging.error(f"Final timeout on {label} after {MAX_RETRIES + 1} attempts: {e}")
+                    raise
+                    
+            except requests.exceptions.RequestException as e:
+                if attempt < MAX_RETRIES:
+                    retry_delay = INITIAL_RETRY_DELAY * (RETRY_BACKOFF_FACTOR ** attempt)
+                    logging.warning(f"Request error on {label}, retrying in {retry_delay} seconds: {e}")
+                    time.sleep(retry_delay)
+                else:
+                    logging.error(f"Final error on {label} after {MAX_RETRIES + 1} attempts: {e}")
+                    raise
+        
+        raise Exception(f"Failed to fetch {label} after {MAX_RETRIES + 1} attempts")
+    
+    def _fetch_pages(self, url: str, headers: Dict[str, str], created_filter: Optional[str] = None,
+                     label: str = '') -> List[Dict[str, Any]]:
+        """Walk page=1..N, optionally restricted to a created_at filter"""
         all_transactions = []
         page = 1
         per_page = 100  # Classy API default/max per page
         
         while True:
-            url = f"{CLASSY_API_BASE_URL}/campaigns/{CAMPAIGN_ID}/transactions"
             params = {
                 'page': page,
                 'per_page': per_page,
                 'with': 'fundraising_team,fundraising_page,member'  # Include related data
             }
+            if created_filter:
+                params['filter'] = created_filter
             
-            # Retry logic for this page
-            success = False
-            for attempt in range(MAX_RETRIES + 1):  # +1 for initial attempt
-                try:
-                    if attempt == 0:
-                        logging.info(f"Fetching page {page} of transactions...")
-                    else:
-                        logging.info(f"Retrying page {page} (attempt {attempt + 1}/{MAX_RETRIES + 1})...")
-                    
-                    response = requests.get(
-                        url, 
-                        headers=headers, 
-                        params=params, 
-                        timeout=REQUEST_TIMEOUT
-                    )
-                    response.raise_for_status()
-                    
-                    data = response.json()
-                    transactions = data.get('data', [])
-                    
-                    # Success! Break out of retry loop
-                    success = True
-                    break
-                    
-                except requests.exceptions.Timeout as e:
-                    if attempt < MAX_RETRIES:
-                        retry_delay = INITIAL_RETRY_DELAY * (RETRY_BACKOFF_FACTOR ** attempt)
-                        logging.warning(f"Timeout on page {page}, retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
-                    else:
-                        logging.error(f"Final timeout on page {page} after {MAX_RETRIES + 1} attempts: {e}")
-                        raise
-                        
-                except requests.exceptions.RequestException as e:
-                    if attempt < MAX_RETRIES:
-                        retry_delay = INITIAL_RETRY_DELAY * (RETRY_BACKOFF_FACTOR ** attempt)
-                        logging.warning(f"Request error on page {page}, retrying in {retry_delay} seconds: {e}")
-                        time.sleep(retry_delay)
-                    else:
-                        logging.error(f"Final error on page {page} after {MAX_RETRIES + 1} attempts: {e}")
-                        raise
-            
-            if not success:
-                raise Exception(f"Failed to fetch page {page} after {MAX_RETRIES + 1} attempts")
+            page_label = f"page {page}{label}"
+            data = self._get_with_retry(url, headers, params, page_label)
+            transactions = data.get('data', [])
             
             # Process successful response
             if not transactions:
                 break
                 
             all_transactions.extend(transactions)
-            logging.info(f"Successfully fetched {len(transactions)} transactions from page {page}")
+            logging.info(f"Successfully fetched {len(transactions)} transactions from {page_label}")
             
             # Check if there are more pages
             if len(transactions) < per_page:
                 break
                 
             page += 1
-            
-            # Rate limiting - be respectful to the API
-            time.sleep(RATE_LIMIT_DELAY)
         
-        logging.info(f"Total transactions fetched: {len(all_transactions)}")
         return all_transactions
     
+    def _fetch_by_date_windows(self, url: str, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Split the created_at range into windows of about FETCH_WINDOW_TARGET_RECORDS and fetch them in parallel"""
+        first, first_response = self._get_response_with_retry(
+            url, headers, {'page': 1, 'per_page': 1, 'sort': 'created_at:asc'}, 'earliest transaction')
+        earliest = first.get('data', [])
+        if not earliest:
+            return []
+        if 'total' not in first:
+            raise Exception("Classy API response has no 'total'; can't plan date windows")
+        unfiltered_total = int(first['total'])
+        range_start = self._parse_api_datetime(earliest[0]['created_at'])
+        # Fix the upper bound at the API's clock when the probe ran, so donations arriving
+        # mid-run can't shift windows even if the local clock is ahead of Classy's
+        range_end = self._server_time(first_response)
+        
+        # If the API ignored the sort, range_start isn't the earliest record and the range misses data
+        range_total = self._count_window(url, headers, range_start, range_end)
+        if range_total < unfiltered_total:
+            raise Exception(
+                f"Date range from {self._format_api_datetime(range_start)} holds {range_total} of "
+                f"{unfiltered_total} transactions; the API may have ignored sort=created_at")
+        
+        windows = self._plan_date_windows(url, headers, range_start, range_end, range_total)
+        logging.info(f"Fetching {len(windows)} date windows with {FETCH_WORKERS} workers...")
+        
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            results = list(executor.map(
+                lambda window: self._fetch_pages(
+                    url, headers, self._created_filter(*window),
+                    f" of window {self._format_api_datetime(window[0])}"),
+                windows
+            ))
+        
+        # Windows are half-open, but dedupe in case the API treats a boundary inclusively.
+        # Records without an id can't be matched, so they are all kept
+        all_transactions = []
+        seen_ids = set()
+        fetched_count = 0
+        for window_transactions in results:
+            fetched_count += len(window_transactions)
+            for transaction in window_transactions:
+                transaction_id = transaction.get('id')
+                if transaction_id is not None:
+                    if transaction_id in seen_ids:
+                        continue
+                    seen_ids.add(transaction_id)
+                all_transactions.append(transaction)
+        
+        duplicates = fetched_count - len(all_transactions)
+        if duplicates:
+            logging.info(f"Removed {duplicates} duplicate transactions across date windows")
+        return all_transactions
+    
+    def _plan_date_windows(self, url: str, headers: Dict[str, str], range_start: datetime,
+                           range_end: datetime, range_total: int) -> List[tuple]:
+        """Bisect [range_start, range_end) until each window holds at most the target record count"""
+        windows = []
+        pending = [(range_start, range_end, range_total)]
+        
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            while pending:
+                splits = []
+                for start, end, count in pending:
+                    midpoint = (start + (end - start) / 2).replace(microsecond=0)
+                    # Stop splitting at one-second windows; pagination handles any overflow
+                    if count <= FETCH_WINDOW_TARGET_RECORDS or midpoint <= start:
+                        windows.append((start, end))
+                    else:
+                        splits.append((start, midpoint, end, count))
+                
+                if len(windows) + 2 * len(splits) > FETCH_MAX_WINDOWS:
+                    raise Exception(
+                        f"Date window planning exceeded FETCH_MAX_WINDOWS ({FETCH_MAX_WINDOWS}); "
+                        f"raise FETCH_WINDOW_TARGET_RECORDS or use the 'pages' strategy")
+                
+                halves = [(start, midpoint) for start, midpoint, _, _ in splits] + \
+                         [(midpoint, end) for _, midpoint, end, _ in splits]
+                counts = list(executor.map(lambda window: self._count_window(url, headers, *window), halves))
+                left_counts, right_counts = counts[:len(splits)], counts[len(splits):]
+                
+                pending = []
+                for (start, midpoint, end, count), left, right in zip(splits, left_counts, right_counts):
+                    # An ignored filter reports the full total for both halves
+                    if left + right != count:
+                        raise Exception(
+                            f"Window {self._format_api_datetime(start)} holds {count} transactions but its halves "
+                            f"hold {left} + {right}; the API may have ignored the created_at filter")
+                    pending.extend(
+                        (window_start, window_end, window_count)
+                        for window_start, window_end, window_count in [(start, midpoint, left), (midpoint, end, right)]
+                        if window_count > 0
+                    )
+        
+        return sorted(windows)
+    
+    def _count_window(self, url: str, headers: Dict[str, str], start: datetime, end: datetime) -> int:
+        """Return the number of transactions created in [start, end)"""
+        params = {'page': 1, 'per_page': 1, 'filter': self._created_filter(start, end)}
+        data = self._get_with_retry(url, headers, params, f"count of window {self._format_api_datetime(start)}")
+        if 'total' not in data:
+            raise Exception(f"Classy API response for window {self._format_api_datetime(start)} has no 'total'")
+        return int(data['total'])
+    
+    @staticmethod
+    def _created_filter(start: datetime, end: datetime) -> str:
+        """Build a Classy filter for created_at in [start, end)"""
+        return (f"created_at>={ClassyAPIClient._format_api_datetime(start)},"
+                f"created_at<{ClassyAPIClient._format_api_datetime(end)}")
+    
+    @staticmethod
+    def _format_api_datetime(dt: datetime) -> str:
+        """Format a UTC datetime the way the Classy API expects in filters"""
+        return dt.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+0000')
+    
+    @staticmethod
+    def _parse_api_datetime(date_string: str) -> datetime:
+        """Parse a Classy API timestamp into an aware UTC datetime"""
+        # strptime's %z accepts Z, +0000 and +00:00 on every Python 3.7+, unlike fromisoformat before 3.11
+        date_string = re.sub(r'\.\d+', '', date_string)
+        try:
+            dt = datetime.strptime(date_string, '%Y-%m-%dT%H:%M:%S%z')
+        except ValueError:
+            dt = datetime.strptime(date_string, '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    
+    @staticmethod
+    def _server_time(response: requests.Response) -> datetime:
+        """Return the response's Date header as a UTC datetime, or the local clock if it's missing"""
+        try:
+            return parsedate_to_datetime(response.headers['Date']).astimezone(timezone.utc)
+        except (KeyError, TypeError, ValueError):
+            logging.warning("Classy API response has no valid Date header; using the local clock for the date range")
+            return datetime.now(timezone.utc).replace(microsecond=0)
 
 
-class JSONFileClient:
-    """Client for writing transaction data to JSON file"""
+# Column order for tabular outputs (CSV, spreadsheets), matching TransactionProcessor output
+TRANSACTION_FIELDS = [
+    'transaction_id', 'amount', 'currency', 'fee_amount', 'net_amount', 'status', 'type',
+    'payment_method', 'created_date', 'updated_date', 'member_name', 'member_email',
+    'fundraising_page_title', 'fundraising_team_name', 'campaign_id', 'designation_id',
+    'comment', 'is_anonymous', 'is_recurring', 'tribute_info'
+]
+
+
+class OutputSink(ABC):
+    """Base class for an output target fed in batches of processed transactions"""
     
-    def __init__(self):
-        self.output_path = OUTPUT_FILE_PATH
-        logging.info(f"JSON file output configured for: {self.output_path}")
+    name = 'sink'
+    # Only a required sink's failure fails the sync; other sinks log their errors
+    required = False
+    
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = batch_size
+    
+    def open(self, total: int):
+        """Prepare the target before the first batch"""
     
-    def write_transactions(self, transactions_data: List[Dict[str, Any]]):
-        """Write transaction data to JSON file"""
+    @abstractmethod
+    def write_batch(self, batch: List[Dict[str, Any]]):
+        """Write one batch of processed transactions"""
+    
+    def close(self):
+        """Publish the written data, replacing the previous output"""
+    
+    def abort(self):
+        """Discard partially written data, leaving the previous output in place"""
+    
+    def write(self, transactions_data: List[Dict[str, Any]]):
+        """Write all transactions to this sink in batches of batch_size"""
+        self.open(len(transactions_data))
         try:
-            # Create directory if it doesn't exist (only if there's a directory path)
-            dir_path = os.path.dirname(self.output_path)
-            if dir_path:
-                os.makedirs(dir_path, exist_ok=True)
-            
-            # Prepare JSON data with metadata
-            json_data = {
-                'metadata': {
-                    'generated_at': datetime.now().isoformat(),
-                    'total_transactions': len(transactions_data),
-                    'script_version': '2025-08-21'
-                },
-                'transactions': transactions_data
-            }
-            
-            # Write to JSON file
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
-            
-            logging.info(f"Successfully wrote {len(transactions_data)} transactions to {self.output_path}")
-            
-        except Exception as e:
-            logging.error(f"Error writing JSON file: {e}")
+            for offset in range(0, len(transactions_data), self.batch_size):
+                self.write_batch(transactions_data[offset:offset + self.batch_size])
+        except Exception:
+            self.abort()
             raise
+        self.close()
+        logging.info(f"Successfully wrote {len(transactions_data)} transactions to {self.name}")
+
+
+def _make_parent_dir(path: str):
+    """Create the directory for path if it doesn't exist (only if there's a directory path)"""
+    dir_path = os.path.dirname(path)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+
+
+class JSONFileSink(OutputSink):
+    """Write transactions with metadata to a JSON file for WordPress"""
+    
+    required = True
+    
+    def __init__(self, output_path: str = OUTPUT_FILE_PATH):
+        super().__init__()
+        self.output_path = output_path
+        self.name = output_path
+    
+    def write(self, transactions_data: List[Dict[str, Any]]):
+        """Dump the whole list in one go; the JSON file can't be built up in batches"""
+        self.write_batch(transactions_data)
+        logging.info(f"Successfully wrote {len(transactions_data)} transactions to {self.name}")
+    
+    def write_batch(self, batch: List[Dict[str, Any]]):
+        _make_parent_dir(self.output_path)
+        
+        # Prepare JSON data with metadata
+        json_data = {
+            'metadata': {
+                'generated_at': datetime.now().isoformat(),
+                'total_transactions': len(batch),
+                'script_version': '2025-08-21'
+            },
+            'transactions': batch
+        }
+        
+        # Write to a temp file and swap it in so WordPress never reads a partial file
+        temp_path = f"{self.output_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.output_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+class CSVFileSink(OutputSink):
+    """Write transactions to a CSV file for finance"""
+    
+    def __init__(self, output_path: str, batch_size: int = CSV_BATCH_SIZE):
+        super().__init__(batch_size)
+        self.output_path = output_path
+        self.temp_path = f"{output_path}.tmp"
+        self.name = output_path
+        self._file = None
+        self._writer = None
+    
+    def open(self, total: int):
+        _make_parent_dir(self.output_path)
+        self._file = open(self.temp_path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=TRANSACTION_FIELDS, extrasaction='ignore')
+        self._writer.writeheader()
+    
+    def write_batch(self, batch: List[Dict[str, Any]]):
+        self._writer.writerows(batch)
+    
+    def close(self):
+        self._file.close()
+        os.replace(self.temp_path, self.output_path)
+        self._file = None
+        self._writer = None
+    
+    def abort(self):
+        if self._file:
+            self._file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+        self._file = None
+        self._writer = None
+
+
+class GoogleSheetsClient:
+    """Client for replacing the rows of a Google Sheets worksheet
+    
+    Rows are written to a staging worksheet and copied into the live worksheet on
+    commit, so readers never see a half-filled sheet and a failed run keeps the old
+    data. The live worksheet keeps its sheet ID, so references from other tabs survive.
+    """
+    
+    def __init__(self, sheet_id: str = GOOGLE_SHEET_ID, worksheet_name: str = GOOGLE_WORKSHEET_NAME,
+                 credentials_file: str = GOOGLE_CREDENTIALS_FILE):
+        self.sheet_id = sheet_id
+        self.worksheet_name = worksheet_name
+        self.credentials_file = credentials_file
+        self.staging_name = f"{worksheet_name} (staging)"
+        self.name = f"Google Sheet {sheet_id}/{worksheet_name}"
+        self.spreadsheets = None
+        self._staging_id = None
+        self._row_count = 0
+        self._column_count = 0
+    
+    def _connect(self):
+        """Load credentials and build the Sheets service"""
+        # Google libraries are only needed when a sheet is configured. Loading them here
+        # means a missing package or credentials file fails this sink on its own thread
+        from google.oauth2.service_account import Credentials
+        from googleapiclient.discovery import build
+        
+        credentials = Credentials.from_service_account_file(
+            self.credentials_file,
+            scopes=['https://www.googleapis.com/auth/spreadsheets']
+        )
+        self.spreadsheets = build('sheets', 'v4', credentials=credentials, cache_discovery=False).spreadsheets()
+    
+    def _worksheet_properties(self) -> Dict[str, Dict[str, Any]]:
+        """Map worksheet titles to their sheet properties"""
+        spreadsheet = self.spreadsheets.get(spreadsheetId=self.sheet_id, fields='sheets.properties').execute()
+        return {sheet['properties']['title']: sheet['properties'] for sheet in spreadsheet['sheets']}
+    
+    def _batch_update(self, requests_body: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self.spreadsheets.batchUpdate(spreadsheetId=self.sheet_id, body={'requests': requests_body}).execute()
+    
+    def start(self, headers: List[str]):
+        """Create an empty staging worksheet and write the header row"""
+        if self.spreadsheets is None:
+            self._connect()
+        stale = self._worksheet_properties().get(self.staging_name)
+        if stale is not None:
+            self._batch_update([{'deleteSheet': {'sheetId': stale['sheetId']}}])
+        reply = self._batch_update([{'addSheet': {'properties': {'title': self.staging_name}}}])
+        self._staging_id = reply['replies'][0]['addSheet']['properties']['sheetId']
+        self.spreadsheets.values().update(
+            spreadsheetId=self.sheet_id,
+            range=f"'{self.staging_name}'!A1",
+            valueInputOption='RAW',
+            body={'values': [headers]}
+        ).execute()
+        self._row_count = 1
+        self._column_count = len(headers)
+    
+    def append_rows(self, rows: List[List[Any]]):
+        """Append rows to the staging worksheet in one request"""
+        self.spreadsheets.values().append(
+            spreadsheetId=self.sheet_id,
+            range=f"'{self.staging_name}'",
+            valueInputOption='RAW',
+            insertDataOption='INSERT_ROWS',
+            body={'values': rows}
+        ).execute()
+        self._row_count += len(rows)
+    
+    def commit(self):
+        """Copy the staging worksheet into the live worksheet and drop staging, in a single batch update"""
+        live = self._worksheet_properties().get(self.worksheet_name)
+        if live is None:
+            # First run: the staging worksheet simply becomes the live one
+            self._batch_update([{'updateSheetProperties': {
+                'properties': {'sheetId': self._staging_id, 'title': self.worksheet_name},
+                'fields': 'title'
+            }}])
+            self._staging_id = None
+            return
+        
+        live_id = live['sheetId']
+        grid = live.get('gridProperties', {})
+        self._batch_update([
+            # Grow the live grid if needed; never shrink it, so references to later rows stay valid
+            {'updateSheetProperties': {
+                'properties': {'sheetId': live_id, 'gridProperties': {
+                    'rowCount': max(grid.get('rowCount', 0), self._row_count),
+                    'columnCount': max(grid.get('columnCount', 0), self._column_count),
+                }},
+                'fields': 'gridProperties.rowCount,gridProperties.columnCount'
+            }},
+            # Clear old values but keep formatting
+            {'updateCells': {'range': {'sheetId': live_id}, 'fields': 'userEnteredValue'}},
+            {'copyPaste': {
+                'source': {'sheetId': self._staging_id, 'startRowIndex': 0, 'endRowIndex': self._row_count,
+                           'startColumnIndex': 0, 'endColumnIndex': self._column_count},
+                'destination': {'sheetId': live_id, 'startRowIndex': 0, 'startColumnIndex': 0},
+                'pasteType': 'PASTE_VALUES'
+            }},
+            {'deleteSheet': {'sheetId': self._staging_id}},
+        ])
+        self._staging_id = None
+    
+    def abort(self):
+        """Delete the staging worksheet, leaving the live worksheet untouched"""
+        if self._staging_id is not None:
+            self._batch_update([{'deleteSheet': {'sheetId': self._staging_id}}])
+        self._staging_id = None
+
+
+class SQLiteSheetClient:
+    """Local SQLite table with the same interface as GoogleSheetsClient
+    
+    Rows go into a staging table inside one transaction, which is renamed over
+    the live table on commit, so a failed run leaves the previous data intact.
+    """
+    
+    def __init__(self, db_path: str = SQLITE_OUTPUT_PATH, table_name: str = SQLITE_TABLE_NAME):
+        self.db_path = db_path
+        self.table_name = table_name
+        self.staging_name = f"{table_name}_staging"
+        self.name = f"{db_path}:{table_name}"
+        self._connection = None
+        self._insert_sql = None
+    
+    def start(self, headers: List[str]):
+        """Begin a transaction and create an empty staging table with one column per header"""
+        _make_parent_dir(self.db_path)
+        # Connect here so the connection belongs to the thread doing the writes.
+        # Autocommit mode so the BEGIN below controls the whole transaction, DDL included
+        self._connection = sqlite3.connect(self.db_path, isolation_level=None)
+        self._connection.execute('BEGIN')
+        columns = ', '.join(f'"{header}"' for header in headers)
+        self._connection.execute(f'DROP TABLE IF EXISTS "{self.staging_name}"')
+        self._connection.execute(f'CREATE TABLE "{self.staging_name}" ({columns})')
+        placeholders = ', '.join('?' for _ in headers)
+        self._insert_sql = f'INSERT INTO "{self.staging_name}" VALUES ({placeholders})'
+    
+    def append_rows(self, rows: List[List[Any]]):
+        """Insert rows into the staging table"""
+        self._connection.executemany(self._insert_sql, rows)
+    
+    def commit(self):
+        """Swap the staging table in for the live table and commit"""
+        self._connection.execute(f'DROP TABLE IF EXISTS "{self.table_name}"')
+        self._connection.execute(f'ALTER TABLE "{self.staging_name}" RENAME TO "{self.table_name}"')
+        self._connection.execute('COMMIT')
+        self._close()
+    
+    def abort(self):
+        """Roll back, leaving the live table untouched"""
+        if self._connection:
+            if self._connection.in_transaction:
+                self._connection.execute('ROLLBACK')
+            self._close()
+    
+    def _close(self):
+        self._connection.close()
+        self._connection = None
+
+
+class SpreadsheetSink(OutputSink):
+    """Write transactions as rows through a sheet client, one append per batch"""
+    
+    def __init__(self, sheet_client, batch_size: int = SPREADSHEET_BATCH_SIZE):
+        super().__init__(batch_size)
+        self.sheet_client = sheet_client
+        self.name = sheet_client.name
+    
+    def open(self, total: int):
+        self.sheet_client.start(TRANSACTION_FIELDS)
+    
+    def write_batch(self, batch: List[Dict[str, Any]]):
+        rows = [[transaction.get(field, '') for field in TRANSACTION_FIELDS] for transaction in batch]
+        self.sheet_client.append_rows(rows)
+    
+    def close(self):
+        self.sheet_client.commit()
+    
+    def abort(self):
+        self.sheet_client.abort()
+
+
+def build_output_sinks() -> List[OutputSink]:
+    """Build the JSON sink plus any additional sinks enabled in config"""
+    sinks: List[OutputSink] = [JSONFileSink(OUTPUT_FILE_PATH)]
+    if CSV_OUTPUT_PATH:
+        sinks.append(CSVFileSink(CSV_OUTPUT_PATH))
+    if SQLITE_OUTPUT_PATH:
+        sinks.append(SpreadsheetSink(SQLiteSheetClient(SQLITE_OUTPUT_PATH, SQLITE_TABLE_NAME)))
+    if GOOGLE_SHEET_ID:
+        sinks.append(SpreadsheetSink(GoogleSheetsClient(GOOGLE_SHEET_ID, GOOGLE_WORKSHEET_NAME, GOOGLE_CREDENTIALS_FILE)))
+    return sinks
+
+
+class JSONFileClient:
+    """Client for writing transaction data to JSON file and any additional output sinks"""
+    
+    def __init__(self, sinks: Optional[List[OutputSink]] = None):
+        self.sinks = sinks if sinks is not None else build_output_sinks()
+        logging.info(f"Output configured for: {', '.join(sink.name for sink in self.sinks)}")
+    
+    def write_transactions(self, transactions_data: List[Dict[str, Any]]) -> List[str]:
+        """Write transaction data to every sink concurrently, one thread per sink
+        
+        Only failures of required sinks (the WordPress JSON file) are raised, so a
+        broken reporting target can't block publishing the JSON export. Returns the
+        names of optional sinks that failed.
+        """
+        failed_optional = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=len(self.sinks) or 1) as executor:
+            futures = {executor.submit(sink.write, transactions_data): sink for sink in self.sinks}
+            # Each sink reads the shared list at its own pace, so a slow sink doesn't hold up the others
+            for future in as_completed(futures):
+                sink = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"Error writing to {sink.name}: {e}")
+                    if sink.required:
+                        errors.append(sink.name)
+                    else:
+                        failed_optional.append(sink.name)
+        
+        if errors:
+            raise Exception(f"Failed to write to: {', '.join(errors)}")
+        return failed_optional
 
 
 class TransactionProcessor:
@@ -337,10 +840,13 @@ def main():
             logging.info("Processing transaction data...")
             processed_transactions = TransactionProcessor.process_transactions(transactions)
             
-            # Write to JSON file
-            logging.info("Writing transactions to JSON file...")
-            json_client.write_transactions(processed_transactions)
-            logging.info(f"Successfully saved {len(processed_transactions)} transactions to JSON file")
+            # Write to JSON file and any additional sinks
+            logging.info("Writing transactions to output sinks...")
+            failed_sinks = json_client.write_transactions(processed_transactions)
+            saved_count = len(json_client.sinks) - len(failed_sinks)
+            logging.info(f"Successfully saved {len(processed_transactions)} transactions to {saved_count} output(s)")
+            if failed_sinks:
+                logging.warning(f"Optional outputs failed and kept their previous data: {', '.join(failed_sinks)}")
         else:
             logging.warning("No transactions found")
         
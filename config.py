@@ -20,12 +20,35 @@ CAMPAIGN_ID = '656775'  # Kept for reference, but using organization-level endpo
 # Output to classy-sync directory for better organization
 OUTPUT_FILE_PATH = 'team-funds-export.json'
 
+# Additional Output Sinks
+# Each sink is written from the same processed data in a single pass. Set a path/ID to enable it.
+CSV_OUTPUT_PATH = None  # e.g. 'team-funds-export.csv' for finance
+CSV_BATCH_SIZE = 1000  # Rows written per batch
+SQLITE_OUTPUT_PATH = None  # e.g. 'reports/transactions.db' for reporting (also a local stand-in for Google Sheets)
+SQLITE_TABLE_NAME = 'transactions'
+GOOGLE_SHEET_ID = None  # Google Sheet to refresh with transaction rows
+GOOGLE_WORKSHEET_NAME = 'Transactions'
+GOOGLE_CREDENTIALS_FILE = 'credentials.json'  # Service account credentials
+SPREADSHEET_BATCH_SIZE = 5000  # Rows per spreadsheet/SQLite append
+
 # Logging Configuration
 LOG_FILE_PATH = 'logs/classy_sync.log'
 
 # Script Configuration
 REQUEST_TIMEOUT = 120  # Timeout for API requests in seconds (increased for large datasets)
-RATE_LIMIT_DELAY = 0.5  # Delay between API requests in seconds
+RATE_LIMIT_DELAY = 0.5  # Minimum delay between API requests in seconds, shared by all fetch workers
 MAX_RETRIES = 3  # Maximum number of retry attempts for failed requests
 RETRY_BACKOFF_FACTOR = 2  # Exponential backoff multiplier for retries
 INITIAL_RETRY_DELAY = 1  # Initial delay before first retry (seconds)
+
+# Fetch Strategy
+# 'pages' walks page=1..N; 'date_windows' splits the created_at range into windows fetched in parallel
+FETCH_STRATEGY = os.getenv('CLASSY_FETCH_STRATEGY', 'pages')
+FETCH_WINDOW_TARGET_RECORDS = 2000  # Target number of transactions per date window
+FETCH_WORKERS = 4  # Date windows fetched in parallel
+FETCH_MAX_WINDOWS = 1000  # Abort window planning beyond this many windows
+
+# Benchmark Configuration
+BENCHMARK_BASELINE_PATH = 'benchmark_baseline.json'  # Saved baseline results for regression checks
+BENCHMARK_REGRESSION_THRESHOLD = 0.25  # Fail if throughput drops or peak memory grows by more than 25%
+BENCHMARK_REPEATS = 3  # Timed runs per benchmark (best run is kept)
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Test script for the output sinks, using SQLite as a local stand-in for Google Sheets
+"""
+
+import sys
+import os
+import csv
+import json
+import time
+import sqlite3
+import tempfile
+
+# Add current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from classy_transactions_sync import (
+    TRANSACTION_FIELDS,
+    OutputSink,
+    JSONFileSink,
+    CSVFileSink,
+    SQLiteSheetClient,
+    SpreadsheetSink,
+    GoogleSheetsClient,
+    JSONFileClient
+)
+import classy_transactions_sync as sync
+import logging
+
+# Set up basic logging
+logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+
+
+def make_transactions(count):
+    """Build processed transactions with every TRANSACTION_FIELDS key"""
+    return [
+        {field: f"{field}-{i}" for field in TRANSACTION_FIELDS} | {'transaction_id': i, 'amount': i * 1.5}
+        for i in range(count)
+    ]
+
+
+def read_sqlite(db_path, table='transactions'):
+    connection = sqlite3.connect(db_path)
+    try:
+        cursor = connection.execute(f'SELECT * FROM "{table}" ORDER BY transaction_id')
+        columns = [description[0] for description in cursor.description]
+        return columns, cursor.fetchall()
+    finally:
+        connection.close()
+
+
+class RecordingSheetClient(SQLiteSheetClient):
+    """SQLite stand-in that records the size of every append"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_sizes = []
+
+    def append_rows(self, rows):
+        self.batch_sizes.append(len(rows))
+        super().append_rows(rows)
+
+
+class FailingSink(OutputSink):
+    """Sink that fails on its first batch"""
+
+    name = 'failing sink'
+
+    def write_batch(self, batch):
+        raise RuntimeError("sink unavailable")
+
+
+class SlowSink(OutputSink):
+    """Sink that takes a while per batch and records when it started and finished"""
+
+    name = 'slow sink'
+
+    def __init__(self, delay):
+        super().__init__(batch_size=100)
+        self.delay = delay
+        self.started_at = None
+        self.finished_at = None
+
+    def open(self, total):
+        self.started_at = time.monotonic()
+
+    def write_batch(self, batch):
+        time.sleep(self.delay)
+
+    def close(self):
+        self.finished_at = time.monotonic()
+
+
+class TimedCSVFileSink(CSVFileSink):
+    """CSV sink that records when it finished"""
+
+    finished_at = None
+
+    def close(self):
+        super().close()
+        self.finished_at = time.monotonic()
+
+
+class FakeSheetsService:
+    """Stand-in for the Sheets API spreadsheets() resource that records batch updates"""
+
+    class Request:
+        def __init__(self, result):
+            self.result = result
+
+        def execute(self):
+            return self.result
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.batch_updates = []
+        self.next_sheet_id = 100
+
+    def get(self, spreadsheetId, fields):
+        return self.Request({'sheets': [{'properties': dict(props)} for props in self.sheets]})
+
+    def batchUpdate(self, spreadsheetId, body):
+        self.batch_updates.append(body['requests'])
+        replies = []
+        for request in body['requests']:
+            if 'addSheet' in request:
+                props = {'title': request['addSheet']['properties']['title'], 'sheetId': self.next_sheet_id}
+                self.next_sheet_id += 1
+                self.sheets.append(props)
+                replies.append({'addSheet': {'properties': props}})
+            elif 'deleteSheet' in request:
+                self.sheets = [p for p in self.sheets if p['sheetId'] != request['deleteSheet']['sheetId']]
+                replies.append({})
+            else:
+                replies.append({})
+        return self.Request({'replies': replies})
+
+    def values(self):
+        return self
+
+    def update(self, **kwargs):
+        return self.Request({})
+
+    def append(self, **kwargs):
+        return self.Request({})
+
+
+def test_spreadsheet_sink_batches():
+    """Rows, column order and batch boundaries through the SQLite stand-in"""
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'report.db')
+        client = RecordingSheetClient(db_path)
+        SpreadsheetSink(client, batch_size=40).write(make_transactions(250))
+
+        columns, rows = read_sqlite(db_path)
+        assert columns == TRANSACTION_FIELDS
+        assert len(rows) == 250
+        assert client.batch_sizes == [40, 40, 40, 40, 40, 40, 10]
+        assert rows[0][0] == 0 and rows[-1][0] == 249
+        assert rows[-1][TRANSACTION_FIELDS.index('member_name')] == 'member_name-249'
+
+
+def test_spreadsheet_sink_empty_input():
+    """An empty run still replaces the table with an empty one"""
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'report.db')
+        SpreadsheetSink(SQLiteSheetClient(db_path), batch_size=40).write(make_transactions(5))
+
+        client = RecordingSheetClient(db_path)
+        SpreadsheetSink(client, batch_size=40).write([])
+
+        columns, rows = read_sqlite(db_path)
+        assert columns == TRANSACTION_FIELDS
+        assert rows == []
+        assert client.batch_sizes == []
+
+
+def test_spreadsheet_sink_failure_keeps_previous_table():
+    """A failure partway through rolls back and leaves the previous data in place"""
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'report.db')
+        SpreadsheetSink(SQLiteSheetClient(db_path), batch_size=40).write(make_transactions(30))
+
+        class BrokenClient(SQLiteSheetClient):
+            def append_rows(self, rows):
+                super().append_rows(rows)
+                if len(rows) < 40:
+                    raise RuntimeError("connection lost")
+
+        try:
+            SpreadsheetSink(BrokenClient(db_path), batch_size=40).write(make_transactions(100))
+            assert False, "expected the sink to fail"
+        except RuntimeError:
+            pass
+
+        _, rows = read_sqlite(db_path)
+        assert len(rows) == 30
+        connection = sqlite3.connect(db_path)
+        tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+        connection.close()
+        assert tables == ['transactions']
+
+
+def test_csv_sink_failure_keeps_previous_file():
+    """A failed CSV write leaves the previous file and no temp file behind"""
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, 'export.csv')
+        CSVFileSink(csv_path, batch_size=7).write(make_transactions(20))
+
+        class BrokenCSVFileSink(CSVFileSink):
+            def write_batch(self, batch):
+                super().write_batch(batch)
+                raise RuntimeError("disk full")
+
+        try:
+            BrokenCSVFileSink(csv_path, batch_size=7).write(make_transactions(50))
+            assert False, "expected the sink to fail"
+        except RuntimeError:
+            pass
+
+        with open(csv_path, encoding='utf-8', newline='') as f:
+            assert len(list(csv.reader(f))) == 21
+        assert os.listdir(workdir) == ['export.csv']
+
+
+def test_fan_out_to_all_sinks():
+    """JSON, CSV and SQLite all receive every row from one write_transactions call"""
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, 'export.json')
+        csv_path = os.path.join(workdir, 'export.csv')
+        db_path = os.path.join(workdir, 'report.db')
+        transactions = make_transactions(1003)
+
+        client = JSONFileClient(sinks=[
+            JSONFileSink(json_path),
+            CSVFileSink(csv_path, batch_size=100),
+            SpreadsheetSink(SQLiteSheetClient(db_path), batch_size=250),
+        ])
+        client.write_transactions(transactions)
+
+        with open(json_path, encoding='utf-8') as f:
+            exported = json.load(f)
+        assert exported['metadata']['total_transactions'] == 1003
+        assert exported['transactions'] == transactions
+
+        with open(csv_path, encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == TRANSACTION_FIELDS
+        assert len(rows) == 1004
+
+        columns, db_rows = read_sqlite(db_path)
+        assert columns == TRANSACTION_FIELDS
+        assert len(db_rows) == 1003
+
+
+def test_slow_sink_does_not_stall_others():
+    """Fast sinks finish while a slow sink is still writing"""
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, 'export.json')
+        csv_sink = TimedCSVFileSink(os.path.join(workdir, 'export.csv'), batch_size=100)
+        slow_sink = SlowSink(delay=0.1)
+
+        JSONFileClient(sinks=[slow_sink, JSONFileSink(json_path), csv_sink]).write_transactions(make_transactions(1000))
+
+        assert os.path.exists(json_path)
+        assert csv_sink.finished_at < slow_sink.started_at + 0.5
+        assert slow_sink.finished_at - slow_sink.started_at >= 1.0
+
+
+def test_optional_sink_failure_is_not_fatal():
+    """Only the JSON sink's failure fails the write"""
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, 'export.json')
+        JSONFileClient(sinks=[JSONFileSink(json_path), FailingSink()]).write_transactions(make_transactions(10))
+        assert os.path.exists(json_path)
+
+        # A directory where the JSON file should be makes the required sink fail
+        blocked_path = os.path.join(workdir, 'blocked')
+        os.makedirs(blocked_path)
+        try:
+            JSONFileClient(sinks=[JSONFileSink(blocked_path)]).write_transactions(make_transactions(10))
+            assert False, "expected the JSON sink failure to be raised"
+        except Exception as e:
+            assert blocked_path in str(e)
+
+
+def test_optional_sink_build_failure_is_not_fatal():
+    """A configured Google Sheet without packages or credentials doesn't block the JSON file"""
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, 'export.json')
+        overrides = {
+            'OUTPUT_FILE_PATH': json_path,
+            'CSV_OUTPUT_PATH': None,
+            'SQLITE_OUTPUT_PATH': None,
+            'GOOGLE_SHEET_ID': 'abc',
+            'GOOGLE_CREDENTIALS_FILE': os.path.join(workdir, 'missing-credentials.json'),
+        }
+        originals = {name: getattr(sync, name) for name in overrides}
+        for name, value in overrides.items():
+            setattr(sync, name, value)
+        try:
+            client = JSONFileClient()
+            failed = client.write_transactions(make_transactions(10))
+        finally:
+            for name, value in originals.items():
+                setattr(sync, name, value)
+
+        assert os.path.exists(json_path)
+        assert failed == ['Google Sheet abc/Transactions']
+
+
+def test_google_sheets_commit_keeps_live_sheet_id():
+    """Committing copies values into the live worksheet instead of replacing it"""
+    client = GoogleSheetsClient('abc', 'Transactions', 'unused.json')
+    client.spreadsheets = FakeSheetsService([
+        {'title': 'Transactions', 'sheetId': 7, 'gridProperties': {'rowCount': 1000, 'columnCount': 26}},
+        {'title': 'Summary', 'sheetId': 8},
+    ])
+    SpreadsheetSink(client, batch_size=40).write(make_transactions(100))
+
+    commit_requests = client.spreadsheets.batch_updates[-1]
+    assert not any(r.get('deleteSheet', {}).get('sheetId') == 7 for r in commit_requests)
+    copy = next(r['copyPaste'] for r in commit_requests if 'copyPaste' in r)
+    assert copy['destination']['sheetId'] == 7
+    assert copy['source']['endRowIndex'] == 101
+    assert copy['source']['endColumnIndex'] == len(TRANSACTION_FIELDS)
+    assert sorted(p['sheetId'] for p in client.spreadsheets.sheets) == [7, 8]
+
+
+def main():
+    print("🧪 Running output sink tests...\n")
+
+    tests = [
+        test_spreadsheet_sink_batches,
+        test_spreadsheet_sink_empty_input,
+        test_spreadsheet_sink_failure_keeps_previous_table,
+        test_csv_sink_failure_keeps_previous_file,
+        test_fan_out_to_all_sinks,
+        test_slow_sink_does_not_stall_others,
+        test_optional_sink_failure_is_not_fatal,
+        test_optional_sink_build_failure_is_not_fatal,
+        test_google_sheets_commit_keeps_live_sheet_id,
+    ]
+
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__doc__}: {e or 'assertion failed'}")
+
+    if failures:
+        print(f"\n⚠️  {failures} of {len(tests)} tests failed.")
+        return 1
+
+    print(f"\n🎉 All {len(tests)} tests passed!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())